@@ -0,0 +1,273 @@
+from __future__ import annotations
+from xmr.stealth.options import get_ua, get_viewport, CHROMIUM_ARGS
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, Error
+import asyncio
+
+# resource types the wallet UI works without; skipping them cuts bytes and memory per page
+_BLOCKED_RESOURCES = {"image", "font", "media"}
+
+
+async def _blockAssets(route: Route) -> None:
+    """Abort requests for images, fonts and media; let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """Process-wide pool of browser contexts sharing a single Chromium instance.
+
+    Playwright and Chromium are started once on first use; contexts are
+    created lazily up to `max_size` and handed back to the pool after each
+    wallet session instead of tearing the browser down.
+
+    Attributes:
+        max_size (int): Maximum number of contexts kept alive at once.
+        _p: Shared Playwright instance.
+        _b: Shared Playwright Browser instance.
+        _contexts (asyncio.Queue[BrowserContext]): Idle contexts ready to be checked out.
+        _created (int): Number of contexts created so far.
+        _lock (asyncio.Lock): Guards the one-time browser launch.
+        _loop (asyncio.AbstractEventLoop | None): Event loop the browser was launched on.
+    """
+
+    max_size: int = 5
+    _p = None
+    _b = None
+    _contexts: asyncio.Queue[BrowserContext] | None = None
+    _created: int = 0
+    _lock = asyncio.Lock()
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def _bindLoop(cls) -> None:
+        """Forget state created on another event loop, which cannot be used from the running one."""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+            cls._p = cls._b = cls._contexts = None
+            cls._created = 0
+
+    @classmethod
+    async def browser(cls) -> Browser:
+        """Return the shared browser, launching it on first use.
+
+        A browser left over from an earlier event loop (e.g. a previous
+        `asyncio.run` that did not call `close`) cannot be driven from the
+        current one, so it is dropped and a new one is launched.
+
+        Returns:
+            Browser: The shared Chromium instance.
+        """
+        cls._bindLoop()
+        async with cls._lock:
+            if cls._b is None:
+                cls._p = await async_playwright().start()
+                cls._b = await cls._p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+                cls._contexts = asyncio.Queue()
+                cls._created = 0
+        return cls._b
+
+    @classmethod
+    async def newContext(cls, storage_state: dict | None = None) -> BrowserContext:
+        """Create a context on the shared browser, outside of the pool.
+
+        The context gets a random user agent and viewport, and does not load
+        images, fonts or media.
+
+        Args:
+            storage_state (dict, optional): Cookies and local storage to start the context with.
+
+        Returns:
+            BrowserContext: A new context; the caller is responsible for closing it.
+        """
+        browser = await cls.browser()
+        context = await browser.new_context(
+            user_agent=get_ua(),
+            viewport=get_viewport(),
+            java_script_enabled=True,
+            locale="en-US",
+            storage_state=storage_state
+        )
+        await context.route("**/*", _blockAssets)
+        return context
+
+    @classmethod
+    async def acquire(cls) -> BrowserContext:
+        """Check out a browser context, creating one if the pool is not full.
+
+        Returns:
+            BrowserContext: A context for exclusive use until `release` is called.
+        """
+        await cls.browser()
+        try:
+            return cls._contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if cls._created < cls.max_size:
+            cls._created += 1
+            try:
+                return await cls.newContext()
+            except BaseException:
+                # give the slot back, or the pool shrinks for good
+                cls._created -= 1
+                raise
+        return await cls._contexts.get()
+
+    @classmethod
+    async def release(cls, context: BrowserContext, page: Page | None = None) -> None:
+        """Reset a context's cookies and return it to the pool.
+
+        Args:
+            context (BrowserContext): A context previously returned by `acquire`.
+            page (Page, optional): Page opened in the context; its storage is cleared and it is closed.
+        """
+        try:
+            if page is not None:
+                try:
+                    # storage access throws on about:blank and error pages, which have no origin
+                    await page.evaluate("() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }")
+                except Error:
+                    # a crashed or closed page; don't let cleanup hide the caller's error
+                    pass
+                finally:
+                    await page.close()
+        finally:
+            await context.clear_cookies()
+            cls._contexts.put_nowait(context)
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared browser and stop Playwright."""
+        cls._bindLoop()
+        async with cls._lock:
+            if cls._b:
+                await cls._b.close()
+                cls._b = None
+            if cls._p:
+                await cls._p.stop()
+                cls._p = None
+            cls._contexts = None
+            cls._created = 0
+
+
+class PagePool:
+    """Fixed set of pages in one browser context, reused across many short jobs.
+
+    Pages are pre-loaded with `url` so that jobs find them already at their
+    starting point. Released pages are navigated to `url` again (or to
+    `about:blank` without one) to drop their DOM and scripts, and are
+    replaced by a fresh page after `max_uses` jobs, since long-lived pages
+    slowly accumulate memory.
+
+    Attributes:
+        _context (BrowserContext): Context the pages are opened in.
+        _size (int): Number of pages kept in the pool.
+        _max_uses (int): Number of jobs after which a page is recreated.
+        _url (str | None): Page every pooled page is warmed with.
+        _pages (asyncio.Queue[Page]): Idle pages ready to be checked out.
+        _uses (dict[Page, int]): Number of completed jobs per page.
+        _warm (set[Page]): Pages that loaded `url` and have not been used since.
+    """
+
+    __slots__ = ("_context", "_size", "_max_uses", "_url", "_pages", "_uses", "_warm")
+
+    def __init__(self, context: BrowserContext, size: int, max_uses: int = 10, url: str | None = None):
+        """Initialize the pool; pages are opened on `async with`.
+
+        Args:
+            context (BrowserContext): Context to open the pages in.
+            size (int): Number of pages kept in the pool.
+            max_uses (int, optional): Number of jobs after which a page is recreated. Defaults to 10.
+            url (str, optional): Page to pre-load in every pooled page. Defaults to None.
+        """
+        self._context = context
+        self._size = size
+        self._max_uses = max_uses
+        self._url = url
+        self._pages: asyncio.Queue[Page] = asyncio.Queue()
+        self._uses: dict[Page, int] = {}
+        self._warm: set[Page] = set()
+
+    async def __aenter__(self) -> PagePool:
+        """Open the pool's pages and load `url` in all of them concurrently.
+
+        Returns:
+            PagePool: The pool itself.
+        """
+        pages = await asyncio.gather(*[self._context.new_page() for _ in range(self._size)])
+        if self._url is not None:
+            # a page that failed to load is still usable; the job navigates it itself
+            results = await asyncio.gather(*[page.goto(self._url) for page in pages], return_exceptions=True)
+            self._warm.update(page for page, result in zip(pages, results) if not isinstance(result, BaseException))
+        for page in pages:
+            self._uses[page] = 0
+            self._pages.put_nowait(page)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close every page of the pool."""
+        await asyncio.gather(*[page.close() for page in self._uses], return_exceptions=True)
+        self._uses.clear()
+        self._warm.clear()
+
+    async def acquire(self) -> Page:
+        """Check out a page, recreating it first if it reached `max_uses`.
+
+        Returns:
+            Page: A page for exclusive use until `release` is called.
+        """
+        page = await self._pages.get()
+        if self._uses[page] >= self._max_uses:
+            try:
+                await page.close()
+                fresh = await self._context.new_page()
+            except BaseException:
+                # keep the worn-out entry queued so the next acquire retries the replacement
+                self._pages.put_nowait(page)
+                raise
+            del self._uses[page]
+            self._warm.discard(page)
+            page = fresh
+            self._uses[page] = 0
+            if self._url is not None:
+                try:
+                    await page.goto(self._url)
+                    self._warm.add(page)
+                except Exception:
+                    pass
+        return page
+
+    def isWarm(self, page: Page) -> bool:
+        """Return whether a checked-out page has freshly loaded `url` and is still untouched.
+
+        Args:
+            page (Page): A page previously returned by `acquire`.
+
+        Returns:
+            bool: True if the page can be used without navigating to `url` first.
+        """
+        return page in self._warm
+
+    async def release(self, page: Page) -> None:
+        """Reload `url` (or blank the page) and return it to the pool.
+
+        Args:
+            page (Page): A page previously returned by `acquire`.
+        """
+        self._uses[page] += 1
+        self._warm.discard(page)
+        try:
+            await page.goto(self._url or "about:blank")
+            if self._url is not None:
+                self._warm.add(page)
+        except Exception:
+            # the page is unusable; let the next acquire replace it
+            self._uses[page] = self._max_uses
+        self._pages.put_nowait(page)
+
+
+__all__ = [ "BrowserPool", "PagePool" ]
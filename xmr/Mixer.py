@@ -1,11 +1,13 @@
 from dataclasses import dataclass
-from xmr.Wallet import Wallet
+from xmr.Wallet import Wallet, _ActiveBrowserWallet, _ActiveRPCWallet
 import random
+import secrets
 from xmr.exceptions import TransactionException
+from xmr.retry import retry
 import asyncio
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletChain:
     """Represents a chain of wallets used for mixing transactions.
 
@@ -20,6 +22,42 @@ class WalletChain:
     
 TRANSFER_APPROX_MINS = 25
 
+
+async def _wait_for_credit(wallet: _ActiveBrowserWallet | _ActiveRPCWallet, min_amount: float, timeout: float = 60*TRANSFER_APPROX_MINS, poll: float = 15, max_poll: float = 60) -> bool:
+    """Wait until a wallet's unlocked balance reaches a minimum amount.
+
+    On wallet-rpc sessions the unlocked balance is polled at exponentially growing
+    intervals, so a transfer that unlocks early does not have to wait for the full
+    `timeout`. The MyMonero UI does not tell locked and unlocked funds apart, so
+    browser sessions always wait the full `timeout`.
+
+    Args:
+        wallet (_ActiveBrowserWallet | _ActiveRPCWallet): Active session of the wallet expected to receive funds.
+        min_amount (float): The unlocked balance in XMR to wait for.
+        timeout (float): The maximum time to wait in seconds.
+        poll (float): The initial polling interval in seconds.
+        max_poll (float): The maximum polling interval in seconds.
+
+    Returns:
+        bool: True if the balance was reached (on browser sessions: once `timeout` has passed),
+              False if the timeout expired first.
+    """
+    if not isinstance(wallet, _ActiveRPCWallet):
+        await asyncio.sleep(timeout)
+        return True
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        if await wallet.getUnlockedBalance() >= min_amount:
+            return True
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(poll, remaining))
+        poll = min(poll*2, max_poll)
+
+
 class DominoMixer:
     """
     Monero mixer that transfers funds sequentially through multiple wallets.
@@ -29,6 +67,8 @@ class DominoMixer:
     similar to dominoes falling one after another, ensuring a step-by-step 
     movement rather than all-at-once transfers.
     """
+
+    __slots__ = ("_middlemen", "_chain")
     
     def __init__(self, wallet_chain: WalletChain):
         """Initialize the DominoMixer with a given wallet chain.
@@ -36,8 +76,8 @@ class DominoMixer:
         Args:
             wallet_chain (WalletChain): The chain of wallets to be used in the mixing process.
         """
-        wallet_chain.middlemen = wallet_chain.middlemen.copy()
-        random.shuffle(wallet_chain.middlemen)
+        self._middlemen = list(wallet_chain.middlemen)
+        secrets.SystemRandom().shuffle(self._middlemen)
         self._chain = wallet_chain
     
     
@@ -45,41 +85,70 @@ class DominoMixer:
         """Start the domino mixing process.
 
         Sequentially transfers funds through each wallet in the chain until reaching the destination.
+        The session of each receiving middleman is opened while the sender's is closed, and is kept 
+        open to watch for the incoming funds and then to send the next hop. The destination wallet
+        is never opened.
 
         Args:
             amount (float): The amount of XMR to send through the chain.
             max_attempts (int): The maximum number of retry attempts per transfer.
 
         Raises:
-            TransactionException: If a wallet does not have enough balance, or 
-                                  if sending fails after all retry attempts.
+            TransactionException: If a wallet does not have enough balance, if sending fails after
+                                  all retry attempts, or if received funds do not unlock in time.
         """
-        path = self._chain.middlemen + [self._chain.to_wallet]
+        path = self._middlemen + [self._chain.to_wallet]
         current_wallet = self._chain.from_wallet
         print(f"Domino mixing will take high-approx {self.approxMinutes}mins.")
 
-        for i, next_wallet in enumerate(path):
-            async with current_wallet as wallet:
+        wallet = await current_wallet.__aenter__()
+        try:
+            for i, next_wallet in enumerate(path):
                 # calculate fees & balance
-                transferFee = await wallet.getTransferFee(priority="low")
-                balance = await wallet.getBalance()
+                balance, transferFee = await wallet.getBalanceAndFee(priority="low")
                 if balance < amount + transferFee * (self.transfersN - i):
                     raise TransactionException("Not enough balance for transfer + fee")
 
-                for attempt in range(max_attempts):
-                    try:
-                        await wallet.send(amount=amount, to_address=next_wallet.address, priority="low")
-                        break
-                    except TransactionException as e:
-                        print(f"Attempt {attempt+1} failed: {e}")
-                        await asyncio.sleep(3)
-                else:
-                    raise TransactionException(f"Failed to send from {current_wallet.address} to {next_wallet.address} after {max_attempts} attempts")
+                try:
+                    await retry(
+                        lambda: wallet.send(amount=amount, to_address=next_wallet.address, priority="low"),
+                        max_attempts=max_attempts,
+                        exceptions=(TransactionException,),
+                        on_error=lambda attempt, e: print(f"Attempt {attempt+1} failed: {e}")
+                    )
+                except TransactionException as e:
+                    raise TransactionException(f"Failed to send from {current_wallet.address} to {next_wallet.address} after {max_attempts} attempts") from e
                 print(f"Transferred {amount} XMR from {current_wallet.address} to {next_wallet.address}")
-        
-            current_wallet = next_wallet  # move to the next wallet
-            await asyncio.sleep(60*TRANSFER_APPROX_MINS)    
-            
+                if i == len(path) - 1:
+                    break  # the destination only receives; never log into it
+
+                # log into the next wallet while the current session closes
+                closing = asyncio.create_task(current_wallet.__aexit__(None, None, None))
+                opening = asyncio.create_task(next_wallet.__aenter__())
+                current_wallet = None  # closed by `closing` from here on
+                try:
+                    closed, opened = await asyncio.gather(closing, opening, return_exceptions=True)
+                except asyncio.CancelledError:
+                    # don't leak a session that finished opening before the cancellation
+                    await asyncio.wait([closing, opening])
+                    if not opening.cancelled() and opening.exception() is None:
+                        await next_wallet.__aexit__(None, None, None)
+                    raise
+
+                errors = [e for e in (closed, opened) if isinstance(e, BaseException)]
+                if errors:
+                    if not isinstance(opened, BaseException):
+                        await next_wallet.__aexit__(None, None, None)
+                    if len(errors) == 1:
+                        raise errors[0]
+                    raise BaseExceptionGroup("Failed to switch wallet sessions", errors)
+
+                current_wallet, wallet = next_wallet, opened  # move to the next wallet
+                if not await _wait_for_credit(wallet, amount):
+                    raise TransactionException(f"Funds sent to {current_wallet.address} not unlocked after {TRANSFER_APPROX_MINS} mins")
+        finally:
+            if current_wallet is not None:
+                await current_wallet.__aexit__(None, None, None)
         
     
     @property
@@ -89,7 +158,7 @@ class DominoMixer:
         Returns:
             int: The number of transfers including the final one to the destination wallet.
         """
-        return 1+len(self._chain.middlemen)
+        return 1+len(self._middlemen)
     
     @property
     def approxMinutes(self) -> int:
@@ -108,70 +177,82 @@ class LeafwayMixer:
     The process first sends portions of the total amount to each middleman, waits for confirmation, 
     and then transfers all funds from the middlemen to the destination wallet.
     """
+
+    __slots__ = ("_middlemen", "_chain")
+
     def __init__(self, wallet_chain: WalletChain):
         """Initialize the LeafwayMixer with a given wallet chain.
 
         Args:
             wallet_chain (WalletChain): The chain of wallets to be used in the mixing process.
         """
-        wallet_chain.middlemen = wallet_chain.middlemen.copy()
-        random.shuffle(wallet_chain.middlemen)
+        self._middlemen = list(wallet_chain.middlemen)
+        secrets.SystemRandom().shuffle(self._middlemen)
         self._chain = wallet_chain
 
-    async def start(self, amount: float, max_attempts: int = 5) -> None:
+    async def start(self, amount: float, max_attempts: int = 5, max_workers: int = 4) -> None:
         """Start the leafway mixing process.
 
         Splits the amount across multiple middleman wallets, then later consolidates the balances 
-        from those middlemen into the final destination wallet.
+        from those middlemen into the final destination wallet, draining up to `max_workers` 
+        middlemen concurrently.
 
         Args:
             amount (float): The total amount of XMR to mix through middlemen.
             max_attempts (int): The maximum number of retry attempts per transfer.
+            max_workers (int): The maximum number of middlemen drained concurrently.
 
         Raises:
-            TransactionException: If the source wallet does not have enough balance for transfers + fees.
+            TransactionException: If the source wallet does not have enough balance for transfers + fees,
+                                  or if a transfer to a middleman fails after all retry attempts.
+            ExceptionGroup: If draining any middleman fails; the other drains are still completed.
         """
         print(f"Leafway mixing will take high-approx {self.approxMinutes}mins.")
         
         async with self._chain.from_wallet as from_wallet:
-            transferFee = await from_wallet.getTransferFee(priority="low")
-            balance = await from_wallet.getBalance()
+            balance, transferFee = await from_wallet.getBalanceAndFee(priority="low")
             if balance < amount + transferFee*self.transfersN:
                 raise TransactionException("Not enough balance for transfer + fee")
 
-            transfer_amount = amount / len(self._chain.middlemen)
+            transfer_amount = amount / len(self._middlemen)
             
-            for middleman in self._chain.middlemen:
-                for _ in range(max_attempts):
-                    try:
-                        await from_wallet.send(transfer_amount, middleman.address, priority="low")
-                        break
-                    except TransactionException:
-                        await asyncio.sleep(3.5)
+            for middleman in self._middlemen:
+                await retry(
+                    lambda: from_wallet.send(transfer_amount, middleman.address, priority="low"),
+                    max_attempts=max_attempts,
+                    exceptions=(TransactionException,)
+                )
                 print(f"Transferred from main[{from_wallet.address}] to middleman[{middleman.address}]")        
                 await asyncio.sleep(random.uniform(5, 10))
         
         print(f"Waiting for {TRANSFER_APPROX_MINS} mins so every start->middleman transfer goes through.")        
         await asyncio.sleep(TRANSFER_APPROX_MINS*60)
         
-        for middleman in self._chain.middlemen:
-            async with middleman as from_wallet:
-                transferFee = await from_wallet.getTransferFee(priority="low")
-                balance = await from_wallet.getBalance()
-                transfer_amount = balance-transferFee
-                if transfer_amount > 0:
-                    print(f"Transferred from middleman[{from_wallet.address}] to target[{self._chain.to_wallet.address}]")        
-                
-                    for _ in range(max_attempts):
-                        try:
-                            await from_wallet.send(transfer_amount, self._chain.to_wallet.address, priority="low")
-                            break
-                        except TransactionException:
-                            await asyncio.sleep(3.5)
-                        
-                    await asyncio.sleep(random.uniform(5, 10))
-                else:
-                    print(f"Middleman[{from_wallet.address}]'s balance is 0.")      
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def drain(middleman):
+            async with semaphore:
+                async with middleman as from_wallet:
+                    balance, transferFee = await from_wallet.getBalanceAndFee(priority="low")
+                    transfer_amount = balance-transferFee
+                    if transfer_amount > 0:
+                        print(f"Transferred from middleman[{from_wallet.address}] to target[{self._chain.to_wallet.address}]")        
+                    
+                        await retry(
+                            lambda: from_wallet.send(transfer_amount, self._chain.to_wallet.address, priority="low"),
+                            max_attempts=max_attempts,
+                            exceptions=(TransactionException,)
+                        )
+
+                        await asyncio.sleep(random.uniform(5, 10))
+                    else:
+                        print(f"Middleman[{from_wallet.address}]'s balance is 0.")      
+
+        # let every drain run to completion even if one fails, so no send is cut off midway
+        results = await asyncio.gather(*[drain(middleman) for middleman in self._middlemen], return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise BaseExceptionGroup(f"Failed to drain {len(errors)} of {len(self._middlemen)} middlemen", errors)
         
 
 
@@ -182,7 +263,7 @@ class LeafwayMixer:
         Returns:
             int: Twice the number of middlemen (one for splitting, one for consolidating).
         """
-        return len(self._chain.middlemen)*2
+        return len(self._middlemen)*2
 
     @property
     def approxMinutes(self) -> int:
@@ -191,7 +272,7 @@ class LeafwayMixer:
         Returns:
             int: Approximate time in minutes for all transfers, including delays between middlemen transfers.
         """
-        return TRANSFER_APPROX_MINS + len(self._chain.middlemen) * 15
+        return TRANSFER_APPROX_MINS + len(self._middlemen) * 15
 
 
-__all__ = [ "WalletChain", "DominoMixer"]
+__all__ = [ "WalletChain", "DominoMixer", "LeafwayMixer" ]
@@ -7,9 +7,11 @@ class Mnemonic:
     _raw_words : str
         The raw string of words representing the mnemonic.
     _words : list[str]
-        The list of words obtained by splitting the mnemonic string.
+        The list of words obtained by splitting the normalized mnemonic string.
     """
 
+    __slots__ = ("_raw_words", "_words")
+
     def __init__(self, raw_words: str):
         """
         Initialize a Mnemonic object.
@@ -20,7 +22,7 @@ class Mnemonic:
             The raw mnemonic phrase as a single string.
         """
         self._raw_words = raw_words.strip().lower()
-        self._words = raw_words.split(" ")
+        self._words = self._raw_words.split()
     
     def getRawWords(self) -> str:
         """
@@ -1,25 +1,89 @@
 from __future__ import annotations
 from xmr.Mnemonic import Mnemonic
-from xmr.stealth.options import get_ua, get_viewport
-from playwright.async_api import async_playwright, Page
-from xmr.exceptions import TransactionException
+from xmr.WalletRPC import WalletRPC
+from xmr.BrowserPool import BrowserPool, PagePool
+from playwright.async_api import Page, BrowserContext, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from contextlib import asynccontextmanager
+from xmr.exceptions import TransactionException, RPCException, RPCConnectionException, GenerationException
+from xmr.retry import retry
 import asyncio
+import hashlib
 import typing
 import random
+import os
+import re
+import time
+
+_ATOMIC_UNITS = 10**12
+_MYMONERO_URL = "https://wallet.mymonero.com"
+_PRIORITIES = {"low": 1, "medium": 2, "high": 3, "very high": 4}
+_RESTORE_LOCKS: dict[str, asyncio.Lock] = {}
+
+# "mnemonic | address | secretViewKey | secretSpendKey", exactly four fields
+_LINE_RE = re.compile(r"\s*([^|#\s][^|]*?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*$")
+
+# how long a saved MyMonero login is tried before logging in with the mnemonic again
+_STORAGE_STATE_TTL = 30*60
+
+_BALANCE_SELECTOR = "div.selectionDisplayCellView > div.description-label"
+_FEE_SELECTOR = "#stack-view-stage-view > div > div:nth-child(2) > table > tr > td > div > div:nth-child(8) > span"
+
+# amounts as rendered by MyMonero, e.g. "1.25 XMR" and "+ 0.0001 XMR EST. FEE"
+_BAL_RE = re.compile(r"([\d.]+)\s*XMR", re.I)
+_FEE_RE = re.compile(r"\+?\s*([\d.]+)\s*XMR\s*est", re.I)
+
+# resolves with the element's text once it contains a number, evaluated in the page on every DOM change
+_NUMERIC_TEXT_JS = """selector => {
+    const el = document.querySelector(selector);
+    return el && /\\d/.test(el.innerText) ? el.innerText : null;
+}"""
+
+
+def _priorityValue(priority: str) -> int:
+    """Map a priority name to the numeric level used by MyMonero and wallet-rpc.
+
+    Args:
+        priority (str): Transaction priority ("low", "medium", "high", "very high").
+
+    Returns:
+        int: Priority level from 1 to 4.
+
+    Raises:
+        ValueError: If the priority name is unknown.
+    """
+    value = _PRIORITIES.get(priority.lower())
+    if value is None:
+        raise ValueError(f"Unknown transaction priority: {priority!r}")
+    return value
+
 
 class Wallet:
     """Represents a Monero wallet, capable of generating, loading, and interacting
     with MyMonero's browser-based wallet UI via Playwright.
 
+    If `Wallet.rpc` is set to a `WalletRPC` client, `async with wallet` talks
+    JSON-RPC to `monero-wallet-rpc` instead of launching a browser.
+
     Attributes:
-        _p: Playwright instance used for launching the browser.
-        _b: Playwright Browser instance for session management.
-        _mnemonic (Mnemonic): The wallet's mnemonic phrase object.
+        rpc (WalletRPC | None): Shared wallet-rpc client used for sessions instead of Playwright.
+        humanlike (bool): Type mnemonics key by key instead of filling the field at once.
+        _ctx: Browser context of the current session.
+        _ctx_pooled (bool): Whether `_ctx` was checked out from `BrowserPool` or created for a resumed login.
+        _page: Playwright page of the current session.
+        _storage_state (tuple[dict, float] | None): Browser storage after the last login and when it was saved.
+        _r (WalletRPC): The wallet-rpc client holding this wallet open, if any.
+        _mnemonic (Mnemonic | None): The wallet's mnemonic phrase object, built on first use for loaded wallets.
+        _raw_mnemonic (str | None): Mnemonic phrase as read from file, until `_mnemonic` is built.
         _address (str): Wallet's Monero address.
         _viewKey (str): Wallet's secret view key.
         _spendKey (str): Wallet's secret spend key.
     """
 
+    __slots__ = ("_ctx", "_ctx_pooled", "_page", "_storage_state", "_r", "_mnemonic", "_raw_mnemonic", "_address", "_viewKey", "_spendKey")
+
+    rpc: WalletRPC | None = None
+    humanlike: bool = False
+
     def __init__(self, mnemonic: Mnemonic, address: str, secretViewKey: str, secretSpendKey: str):
         """Initialize a Wallet with a mnemonic phrase, address, and keys.
 
@@ -32,19 +96,63 @@ class Wallet:
         Raises:
             RuntimeError: If mnemonic is not an instance of Mnemonic.
         """
-        if type(mnemonic) != Mnemonic:
+        if not isinstance(mnemonic, Mnemonic):
             raise RuntimeError("Mnemonic key not passed into wallet.")
-        self._p = None
-        self._b = None
+        self._setup(mnemonic, address, secretViewKey, secretSpendKey)
+
+    @classmethod
+    def _from_raw(cls, raw_mnemonic: str, address: str, secretViewKey: str, secretSpendKey: str) -> Wallet:
+        """Create a Wallet from a raw mnemonic string, deferring the `Mnemonic` construction to first use.
+
+        Args:
+            raw_mnemonic (str): The wallet's mnemonic phrase as a string.
+            address (str): Wallet's public Monero address.
+            secretViewKey (str): Secret view key associated with the wallet.
+            secretSpendKey (str): Secret spend key associated with the wallet.
+
+        Returns:
+            Wallet: The new wallet.
+        """
+        wallet = cls.__new__(cls)
+        wallet._setup(None, address, secretViewKey, secretSpendKey, raw_mnemonic)
+        return wallet
+
+    def _setup(self, mnemonic: Mnemonic | None, address: str, secretViewKey: str, secretSpendKey: str, raw_mnemonic: str | None = None) -> None:
+        """Set the wallet's attributes; shared by `__init__` and `_from_raw`."""
+        self._ctx = None
+        self._ctx_pooled = False
+        self._page = None
+        self._storage_state = None
+        self._r = None
         self._mnemonic = mnemonic
+        self._raw_mnemonic = raw_mnemonic
         self._address = address
         self._viewKey = secretViewKey
         self._spendKey = secretSpendKey
 
+    @staticmethod
+    @asynccontextmanager
+    async def session() -> typing.AsyncIterator[BrowserContext]:
+        """Open a browser context on the shared `BrowserPool` browser for generating wallets.
+
+        Pages opened in the context can be passed to `generateNew`, so that many
+        generations share one Chromium instance. The context is closed on exit.
+
+        Yields:
+            BrowserContext: A fresh browser context.
+        """
+        context = await BrowserPool.newContext()
+        try:
+            yield context
+        finally:
+            await context.close()
+
     @staticmethod
     async def generateBulk(outfp: str, max_workers: int = 5, total: int = 50) -> list[Wallet]:
         """Generate multiple wallets concurrently and save mnemonics to a file.
 
+        The shared `BrowserPool` browser stays running afterwards; call `BrowserPool.close()` when done.
+
         Args:
             outfp (str): Path to output file for storing wallet information.
             max_workers (int, optional): Maximum number of concurrent workers. Defaults to 5.
@@ -52,36 +160,37 @@ class Wallet:
 
         Returns:
             list[Wallet]: A list of generated Wallet instances.
+
+        Raises:
+            ExceptionGroup: If a worker fails; the remaining workers are cancelled.
         """
-        semaphore = asyncio.Semaphore(max_workers)
+        jobs = asyncio.Queue()
+        for _ in range(total):
+            jobs.put_nowait(None)
         wallets = []
         file_lock = asyncio.Lock()
 
-        with open(outfp, "w") as f:
+        with open(outfp, "w", buffering=64*1024) as f:
             f.write("# Mnemonic | Address | secretViewKey | secretSpendKey\n")
 
-        p = await async_playwright().start()
-        b = await p.chromium.launch(headless=True)
-        context = await b.new_context(
-            user_agent=get_ua(),
-            viewport=get_viewport(),
-            java_script_enabled=True,
-            locale="en-US"
-        )
-
-        async def worker():
-            async with semaphore:
-                wallet = await Wallet._generateWalletWithRetry(context)
-                wallets.append(wallet)
-                async with file_lock:
-                    with open(outfp, "a") as f:
+            async def worker():
+                while True:
+                    try:
+                        jobs.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    wallet = await Wallet._generateWalletWithRetry(pool)
+                    wallets.append(wallet)
+                    async with file_lock:
                         f.write(f"{wallet.mnemonic} | {wallet.address} | {wallet.secretViewKey} | {wallet.secretSpendKey}\n")
-
-        tasks = [asyncio.create_task(worker()) for _ in range(total)]
-        await asyncio.gather(*tasks)
-        
-        await b.close()
-        await p.stop()
+                        # flush every wallet so no mnemonic is lost on a crash, off the event loop
+                        await asyncio.to_thread(f.flush)
+
+            workers = min(max_workers, total)
+            async with Wallet.session() as context, PagePool(context, workers, url=_MYMONERO_URL) as pool:
+                async with asyncio.TaskGroup() as tg:
+                    for _ in range(workers):
+                        tg.create_task(worker())
         
         return wallets
 
@@ -94,23 +203,32 @@ class Wallet:
 
         Returns:
             list[Wallet]: A list of Wallet instances loaded from file.
+
+        Raises:
+            ValueError: If a line other than a blank or `#` comment line does not have exactly four fields.
         """
         wallets = []
-        with open(fp, "r") as f:
-            for line in f.readlines():
-                if line.strip() == "" or line.startswith("#"):
+        with open(fp, "r", buffering=1<<16) as f:
+            for lineno, line in enumerate(f, 1):
+                if line[0] == "#" or line.isspace():
                     continue
-                raw_mnemonic, *args = line.split("|")
-                
-                wallets.append(Wallet(Mnemonic(raw_mnemonic.strip()), *[arg.strip() for arg in args]))
+                m = _LINE_RE.match(line)
+                if m is None:
+                    # callers pick wallets by position, so a skipped line would shift every later role
+                    raise ValueError(f"{fp}:{lineno}: expected 'mnemonic | address | secretViewKey | secretSpendKey'")
+                wallets.append(Wallet._from_raw(m[1], m[2], m[3], m[4]))
         return wallets
 
     @staticmethod
-    async def _generateWalletWithRetry(context, max_retries=5):
-        """Attempt to generate a wallet with retries on failure.
+    async def _generateWalletWithRetry(pool: PagePool, max_retries=5):
+        """Attempt to generate a wallet with retries on browser failures.
+
+        Retries back off exponentially with full jitter, so concurrent workers hit
+        by the same outage do not retry in lockstep. Errors other than browser
+        failures or a missing mnemonic are not retried.
 
         Args:
-            context: Playwright browser context.
+            pool (PagePool): Pool providing a page for each attempt.
             max_retries (int, optional): Maximum number of retries. Defaults to 5.
 
         Returns:
@@ -119,87 +237,114 @@ class Wallet:
         Raises:
             RuntimeError: If wallet generation fails after max_retries.
         """
-        for attempt in range(max_retries):
+        async def attempt():
+            page = await pool.acquire()
             try:
-                page = await context.new_page()
-                wallet = await Wallet.generateNew(page)
-                await page.close()
-                return wallet
-            except Exception as e:
-                print(f"Error generating wallet (attempt {attempt+1}/{max_retries}): {e}")
-                await asyncio.sleep(3 + random.uniform(0, 2))
-        raise RuntimeError("Failed to generate wallet after several retries.")
+                return await Wallet.generateNew(page, loaded=pool.isWarm(page))
+            finally:
+                await pool.release(page)
+
+        try:
+            return await retry(
+                attempt,
+                max_attempts=max_retries,
+                base=0.5,
+                full_jitter=True,
+                exceptions=(PlaywrightError, GenerationException),
+                on_error=lambda attempt, e: print(f"Error generating wallet (attempt {attempt+1}/{max_retries}): {e}")
+            )
+        except (PlaywrightError, GenerationException) as e:
+            raise RuntimeError("Failed to generate wallet after several retries.") from e
 
     @staticmethod
-    async def generateNew(page: Page = None):
+    async def generateNew(page: Page = None, loaded: bool = False):
         """Generate a new wallet using MyMonero's online wallet UI.
 
+        The shared `BrowserPool` browser stays running afterwards; call `BrowserPool.close()` when done.
+
         Args:
-            page (Page, optional): Playwright page object. If None, a new browser will be launched.
+            page (Page, optional): Playwright page object. If None, a context is borrowed from `BrowserPool`.
+            loaded (bool, optional): Whether `page` has just loaded MyMonero and is untouched, so
+                                     navigating to it can be skipped. Defaults to False.
 
         Returns:
             Wallet: A newly generated Wallet instance.
+
+        Raises:
+            GenerationException: If MyMonero does not show a mnemonic for the new wallet.
         """
-        p = None
-        b = None
-        if page == None:
-            p = await async_playwright().start()
-
-            b = await p.chromium.launch(headless=True)
-
-            context = await b.new_context(
-                user_agent=get_ua(),
-                viewport=get_viewport(),
-                java_script_enabled=True,
-                locale="en-US"
-            )
+        if page is None:
+            context = await BrowserPool.acquire()
             page = await context.new_page()
+            try:
+                return await Wallet.generateNew(page)
+            finally:
+                await BrowserPool.release(context, page)
         
-        await page.goto("https://wallet.mymonero.com")
+        if not loaded:
+            await page.goto(_MYMONERO_URL)
         await page.click("a:has-text('Create new wallet')")
         await page.click("a:has-text('GOT IT!')")
         await page.click("#rightBarButtonHolderView > div")
         await asyncio.sleep(random.uniform(0.5, 1.5))
 
-        mnemonic = (await (await page.query_selector("div.mnemonic-container")).inner_text())
-        mnemonic = Mnemonic(mnemonic)
+        container = await page.query_selector("div.mnemonic-container")
+        if container is None:
+            raise GenerationException("MyMonero did not show a mnemonic for the new wallet.")
+        mnemonic = Mnemonic(await container.inner_text())
         
         await asyncio.sleep(random.uniform(3, 5))
         await page.reload()
         await page.click("a:has-text('Use existing wallet')")
-        await page.type("textarea.existing_key", mnemonic.getRawWords())
+        await Wallet._enterMnemonic(page, mnemonic.getRawWords())
         await page.click("#rightBarButtonHolderView > div")
         await asyncio.sleep(random.uniform(0.5, 1.5))
         
         await page.click("div.utility:has(div.walletIcon)")
         await page.click("a.__infoDisclosing_doNotUseForDisclosureToggling")
 
-        address = await (await page.wait_for_selector(
-            "#stack-view-stage-view > div > div:nth-child(3) > div > div:nth-child(1) > div > span.field_value",
-            state="visible")).inner_text()
-
-        secretviewkey = await (await page.wait_for_selector(
-            "#stack-view-stage-view > div > div:nth-child(3) > div > div:nth-child(2) > div > span.field_value",
-            state="visible")).inner_text()
+        # wait for and read all three fields in one round-trip
+        info = await (await page.wait_for_function("""() => {
+            const rows = document.querySelectorAll('#stack-view-stage-view > div > div:nth-child(3) > div > div');
+            const values = Array.from(rows, row => row.querySelector('span.field_value')?.innerText);
+            return values.length >= 3 && values.slice(0, 3).every(Boolean)
+                ? { address: values[0], view: values[1], spend: values[2] }
+                : null;
+        }""", polling="mutation")).json_value()
 
-        secretspendkey = await (await page.wait_for_selector(
-            "#stack-view-stage-view > div > div:nth-child(3) > div > div:nth-child(3) > div > span.field_value",
-            state="visible")).inner_text()
-
-        wallet = Wallet(mnemonic, address, secretviewkey, secretspendkey)
+        wallet = Wallet(mnemonic, info["address"], info["view"], info["spend"])
         print(f"Generated {wallet}")
         
-        if b != None:
-            await b.close()
-        if p != None:
-            await p.stop()
-        
         return wallet
 
+    @staticmethod
+    async def _enterMnemonic(page: Page, mnemonic: str) -> None:
+        """Enter a mnemonic into MyMonero's existing-wallet field.
+
+        The field is filled in a single call, or typed key by key if `Wallet.humanlike` is set.
+
+        Args:
+            page (Page): Page showing the existing-wallet form.
+            mnemonic (str): The mnemonic phrase to enter.
+        """
+        field = page.locator("textarea.existing_key")
+        if Wallet.humanlike:
+            await field.press_sequentially(mnemonic)
+        else:
+            await field.fill(mnemonic)
+
+    @property
+    def _mnemonicObj(self) -> Mnemonic:
+        """Return the wallet's Mnemonic, building it from the raw phrase on first access."""
+        if self._mnemonic is None:
+            self._mnemonic = Mnemonic(self._raw_mnemonic)
+            self._raw_mnemonic = None
+        return self._mnemonic
+
     @property
     def mnemonic(self) -> str:
         """Return the wallet's mnemonic phrase as a string."""
-        return self._mnemonic.getRawWords()
+        return self._mnemonicObj.getRawWords()
 
     @property
     def address(self) -> str:
@@ -216,57 +361,158 @@ class Wallet:
         """Return the wallet's secret spend key."""
         return self._spendKey
 
-    async def __aenter__(self) -> _ActiveBrowserWallet:
-        """Log into MyMonero using the wallet's mnemonic.
+    async def __aenter__(self) -> _ActiveBrowserWallet | _ActiveRPCWallet:
+        """Log into MyMonero using the wallet's mnemonic, or open it on `Wallet.rpc` if configured.
+
+        Returns:
+            _ActiveBrowserWallet | _ActiveRPCWallet: An active wallet session.
+        """
+        if Wallet.rpc is not None:
+            return await self._openRPC(Wallet.rpc)
+
+        if self._storage_state is not None and time.monotonic() - self._storage_state[1] < _STORAGE_STATE_TTL:
+            self._ctx = await BrowserPool.newContext(storage_state=self._storage_state[0])
+            self._ctx_pooled = False
+            try:
+                return await self._resume()
+            except Exception:
+                # the saved login no longer works; fall back to the mnemonic
+                self._storage_state = None
+                await self.__aexit__(None, None, None)
+            except BaseException:
+                await self.__aexit__(None, None, None)
+                raise
+
+        self._ctx = await BrowserPool.acquire()
+        self._ctx_pooled = True
+        try:
+            return await self._login()
+        except BaseException:
+            # __aexit__ is not called when __aenter__ raises; hand the context back here
+            await self.__aexit__(None, None, None)
+            raise
+
+    async def _login(self) -> _ActiveBrowserWallet:
+        """Log into MyMonero in the checked out browser context and save the resulting storage.
 
         Returns:
             _ActiveBrowserWallet: An active browser wallet session.
+
+        Raises:
+            RuntimeError: If the send tab never becomes clickable.
         """
-        self._p = await async_playwright().start()
-        self._b = await self._p.chromium.launch(headless=True)
-
-        context = await self._b.new_context(
-            user_agent=get_ua(),
-            viewport=get_viewport(),
-            java_script_enabled=True,
-            locale="en-US"
-        )
-
-        page = await context.new_page()
-        await page.goto("https://wallet.mymonero.com")
+        page = self._page = await self._ctx.new_page()
+        await page.goto(_MYMONERO_URL)
         await page.click("a:has-text('Use existing wallet')")
-        await page.type("textarea.existing_key", self.mnemonic)
+        await Wallet._enterMnemonic(page, self.mnemonic)
         await page.click("#rightBarButtonHolderView > div")
 
-        send_tab_clickable = False
-        button = None
-        for _ in range(50):
-            button = await page.wait_for_selector("div#tabButton-send", state="visible")
-            if "opacity: 1;" in (await button.get_attribute("style")):
-                send_tab_clickable = True
-                break
-                
-            await asyncio.sleep(0.1)
-        
-        if not send_tab_clickable:
-            raise RuntimeError("An unknown error occurred.")
-        
-        await button.click()
+        try:
+            active = await self._openSendTab(page)
+        except PlaywrightTimeoutError as e:
+            raise RuntimeError("An unknown error occurred.") from e
+
+        self._storage_state = (await self._ctx.storage_state(), time.monotonic())
+        return active
+
+    async def _resume(self) -> _ActiveBrowserWallet:
+        """Open MyMonero in a context restored from a saved login, skipping the mnemonic entry.
+
+        Returns:
+            _ActiveBrowserWallet: An active browser wallet session.
+
+        Raises:
+            playwright.async_api.TimeoutError: If the saved login is not accepted.
+        """
+        page = self._page = await self._ctx.new_page()
+        await page.goto(_MYMONERO_URL)
+        return await self._openSendTab(page, timeout=10000)
+
+    async def _openSendTab(self, page: Page, timeout: float | None = None) -> _ActiveBrowserWallet:
+        """Wait for the logged-in wallet UI and switch to the send tab.
+
+        Args:
+            page (Page): Page with MyMonero open.
+            timeout (float, optional): Maximum wait in milliseconds. Defaults to Playwright's default timeout.
+
+        Returns:
+            _ActiveBrowserWallet: An active browser wallet session.
 
-        return _ActiveBrowserWallet(page, self._mnemonic, self.address, self.secretViewKey, self.secretSpendKey)
+        Raises:
+            playwright.async_api.TimeoutError: If the send tab never becomes clickable.
+        """
+        await page.wait_for_function(
+            "() => { const el = document.querySelector('div#tabButton-send'); return el && el.style.opacity === '1'; }",
+            polling="mutation",
+            timeout=timeout)
+        await page.click("div#tabButton-send")
+
+        return _ActiveBrowserWallet(page, self._mnemonicObj, self.address, self.secretViewKey, self.secretSpendKey)
+
+    @property
+    def _walletId(self) -> str:
+        """Return the file name under which this wallet is stored on wallet-rpc daemons."""
+        return hashlib.blake2b(self.mnemonic.encode(), digest_size=16).hexdigest()
+
+    async def _openRPC(self, rpc: WalletRPC) -> _ActiveRPCWallet:
+        """Open (or restore from the mnemonic) this wallet on a wallet-rpc daemon.
+
+        Restoring scans the chain for the wallet's outputs from the client's
+        restore height, so it only happens when no keys file exists yet;
+        afterwards the stored file is opened. Restoring and refreshing run
+        under the client's scan timeout rather than its per-request one.
+
+        Args:
+            rpc (WalletRPC): Client of the daemon to open the wallet on.
+
+        Returns:
+            _ActiveRPCWallet: An active RPC wallet session.
+        """
+        await rpc.lock.acquire()
+        self._r = rpc
+        try:
+            wallet_id = self._walletId
+            async with _RESTORE_LOCKS.setdefault(wallet_id, asyncio.Lock()):
+                if os.path.exists(os.path.join(rpc.walletDir, f"{wallet_id}.keys")):
+                    await rpc.call("open_wallet", {"filename": wallet_id, "password": rpc.password})
+                else:
+                    await rpc.call("restore_deterministic_wallet", {
+                        "filename": wallet_id,
+                        "seed": self.mnemonic,
+                        "password": rpc.password,
+                        "restore_height": rpc.restoreHeight
+                    }, timeout=rpc.scanTimeout)
+            await rpc.call("refresh", timeout=rpc.scanTimeout)
+        except BaseException:
+            self._r = None
+            rpc.lock.release()
+            raise
+
+        return _ActiveRPCWallet(rpc, self._mnemonicObj, self.address, self.secretViewKey, self.secretSpendKey)
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        """Close the Playwright browser session."""
-        if self._b:
-            await self._b.close()
-            self._b = None
-        if self._p:
-            await self._p.stop()
-            self._p = None
+        """Close the browser session or the wallet opened on the RPC daemon.
+
+        A pooled browser context is wiped and handed back to `BrowserPool`; a context
+        created for a resumed login is closed.
+        """
+        if self._r:
+            try:
+                await self._r.call("close_wallet")
+            finally:
+                self._r.lock.release()
+                self._r = None
+        if self._ctx:
+            ctx, page = self._ctx, self._page
+            self._ctx = self._page = None
+            if self._ctx_pooled:
+                await BrowserPool.release(ctx, page)
+            else:
+                await ctx.close()
 
     def __str__(self):
         """Return a shortened string representation of the wallet."""
-        return f"Wallet('{' '.join(self._mnemonic.getWords()[:3])}'...)')"
+        return f"Wallet('{' '.join(self._mnemonicObj.getWords()[:3])}'...)')"
 
 
 class _ActiveBrowserWallet:
@@ -278,8 +524,16 @@ class _ActiveBrowserWallet:
         _address (str): Wallet's Monero address.
         _viewkey (str): Wallet's secret view key.
         _spendkey (str): Wallet's secret spend key.
+        _fee_cache (dict[str, float]): Fee estimates per priority, cleared after each send.
+        _current_priority (int | None): Priority level last selected in the UI, reset after each send.
+        _loc_* (Locator): Locators of the send form elements, built once per session.
     """
 
+    __slots__ = (
+        "_page", "_mnemonic", "_address", "_viewkey", "_spendkey", "_fee_cache", "_current_priority",
+        "_loc_priority", "_loc_amount", "_loc_to_address", "_loc_submit", "_loc_message"
+    )
+
     def __init__(self, page: Page, mnemonic: Mnemonic, address: str, secretviewkey: str, secretspendkey: str):
         """Initialize an active browser wallet session.
 
@@ -295,6 +549,14 @@ class _ActiveBrowserWallet:
         self._address = address
         self._viewkey = secretviewkey
         self._spendkey = secretspendkey
+        self._fee_cache: dict[str, float] = {}
+        self._current_priority: int | None = None
+
+        self._loc_priority = page.locator("div:nth-child(6) select").first
+        self._loc_amount = page.locator("td > div > input").first
+        self._loc_to_address = page.locator("div.contactPicker_Lite > input").first
+        self._loc_submit = page.locator("#rightBarButtonHolderView > div").first
+        self._loc_message = page.locator("#stack-view-stage-view > div > div.inlineMessageDialogLayer.wantsCloseButton").first
 
     @property
     def address(self) -> str:
@@ -321,18 +583,18 @@ class _ActiveBrowserWallet:
 
         Returns:
             float: The wallet's balance in XMR.
+
+        Raises:
+            playwright.async_api.TimeoutError: If no balance is shown in time.
+            RuntimeError: If the shown balance cannot be parsed.
         """
-        balance = None
-        for _ in range(50):
-            try:
-                balance = float((await (await self._page.wait_for_selector("div.selectionDisplayCellView > div.description-label")).inner_text()).strip(" XMR"))
-                break
-            except ValueError:
-                await asyncio.sleep(0.1)
-        
-        return balance
+        text = await (await self._page.wait_for_function(_NUMERIC_TEXT_JS, arg=_BALANCE_SELECTOR, polling="mutation")).json_value()
+        m = _BAL_RE.search(text)
+        if m is None:
+            raise RuntimeError(f"Unexpected balance text: {text!r}")
+        return float(m[1])
 
-    async def send(self, amount: float, to_address: str, priority: typing.Literal["low", "medium", "hight", "very high"]) -> None:
+    async def send(self, amount: float, to_address: str, priority: typing.Literal["low", "medium", "high", "very high"]) -> None:
         """Send Monero to another address.
 
         Args:
@@ -345,18 +607,19 @@ class _ActiveBrowserWallet:
         """
         await self._set_priority(priority=priority)
         
-        await self._page.fill("td > div > input", "")
-        await self._page.type("td > div > input", str(amount))
-        await self._page.fill("div.contactPicker_Lite > input", "")
-        await self._page.type("div.contactPicker_Lite > input", to_address)
-        await self._page.click("#rightBarButtonHolderView > div")
-
-        errmsg = (await (await self._page.wait_for_selector(
-            "#stack-view-stage-view > div > div.inlineMessageDialogLayer.wantsCloseButton")).inner_text()).strip()
+        await self._loc_amount.fill(str(amount))
+        await self._loc_to_address.fill(to_address)
+        await self._loc_submit.click()
+
+        await self._loc_message.wait_for()
+        errmsg = (await self._loc_message.inner_text()).strip()
         if errmsg:
             raise TransactionException(errmsg)
+        # MyMonero may reset the send form, so select the priority again next time
+        self._fee_cache.clear()
+        self._current_priority = None
 
-    async def getTransferFee(self, priority: typing.Literal["low", "medium", "hight", "very high"]) -> float:
+    async def getTransferFee(self, priority: typing.Literal["low", "medium", "high", "very high"]) -> float:
         """Get the estimated fee for a transaction at a given priority.
 
         Args:
@@ -364,34 +627,234 @@ class _ActiveBrowserWallet:
 
         Returns:
             float: Estimated transaction fee in XMR.
+
+        Raises:
+            playwright.async_api.TimeoutError: If no fee estimate is shown in time.
+            RuntimeError: If the shown fee estimate cannot be parsed.
         """
-        fee = None
-        for _ in range(50):
-            await self._set_priority(priority=priority)
-            fee = await (await self._page.wait_for_selector(
-                "#stack-view-stage-view > div > div:nth-child(2) > table > tr > td > div > div:nth-child(8) > span")).inner_text()
-            try:
-                fee = float(fee.lower().strip(" xmr est. fee").strip("+ "))
-                break
-            except ValueError:
-                await asyncio.sleep(0.1)
+        p = priority.lower()
+        if p in self._fee_cache:
+            return self._fee_cache[p]
+
+        await self._set_priority(priority=priority)
+        text = await (await self._page.wait_for_function(_NUMERIC_TEXT_JS, arg=_FEE_SELECTOR, polling="mutation")).json_value()
+        m = _FEE_RE.search(text)
+        if m is None:
+            raise RuntimeError(f"Unexpected fee text: {text!r}")
+        fee = self._fee_cache[p] = float(m[1])
         return fee
 
-    async def _set_priority(self, priority: typing.Literal["low", "medium", "hight", "very high"]) -> None:
-        """Set transaction priority in the UI.
+    async def getBalanceAndFee(self, priority: typing.Literal["low", "medium", "high", "very high"]) -> tuple[float, float]:
+        """Get the current balance together with the estimated fee at a given priority.
+
+        Args:
+            priority (Literal): Transaction priority ("low", "medium", "high", "very high").
+
+        Returns:
+            tuple[float, float]: The wallet's balance and the estimated transaction fee, in XMR.
+        """
+        fee = await self.getTransferFee(priority=priority)
+        return await self.getBalance(), fee
+
+    async def _set_priority(self, priority: typing.Literal["low", "medium", "high", "very high"]) -> None:
+        """Set transaction priority in the UI, skipping the change if it is already selected.
+
+        Args:
+            priority (Literal): Transaction priority ("low", "medium", "high", "very high").
+
+        Raises:
+            ValueError: If the priority name is unknown.
+        """
+        value = _priorityValue(priority)
+        if value == self._current_priority:
+            return
+        await self._loc_priority.select_option(value=str(value))
+        self._current_priority = value
+
+    def __str__(self) -> str:
+        """Return a string representation of the active wallet."""
+        return f"ActiveWallet({self.address})"
+
+
+class _ActiveRPCWallet:
+    """Represents a wallet opened on a `monero-wallet-rpc` daemon.
+
+    Exposes the same interface as `_ActiveBrowserWallet`, plus `getUnlockedBalance`,
+    which the MyMonero UI has no equivalent for.
+
+    Attributes:
+        _rpc (WalletRPC): Client of the daemon the wallet is opened on.
+        _mnemonic (Mnemonic): Wallet's mnemonic phrase object.
+        _address (str): Wallet's Monero address.
+        _viewkey (str): Wallet's secret view key.
+        _spendkey (str): Wallet's secret spend key.
+        _fee_cache (dict[str, float]): Fee estimates per priority, cleared after each send.
+    """
+
+    __slots__ = ("_rpc", "_mnemonic", "_address", "_viewkey", "_spendkey", "_fee_cache")
+
+    def __init__(self, rpc: WalletRPC, mnemonic: Mnemonic, address: str, secretviewkey: str, secretspendkey: str):
+        """Initialize an active RPC wallet session.
+
+        Args:
+            rpc (WalletRPC): Client of the daemon the wallet is opened on.
+            mnemonic (Mnemonic): Wallet's mnemonic phrase.
+            address (str): Wallet's Monero address.
+            secretviewkey (str): Wallet's secret view key.
+            secretspendkey (str): Wallet's secret spend key.
+        """
+        self._rpc = rpc
+        self._mnemonic = mnemonic
+        self._address = address
+        self._viewkey = secretviewkey
+        self._spendkey = secretspendkey
+        self._fee_cache: dict[str, float] = {}
+
+    @property
+    def address(self) -> str:
+        """Return the wallet's Monero address."""
+        return self._address
+
+    @property
+    def secretViewKey(self) -> str:
+        """Return the wallet's secret view key."""
+        return self._viewkey
+
+    @property
+    def secretSpendKey(self) -> str:
+        """Return the wallet's secret spend key."""
+        return self._spendkey
+
+    @property
+    def secretMnemonic(self) -> Mnemonic:
+        """Return the wallet's mnemonic phrase."""
+        return self._mnemonic
+
+    async def getBalance(self) -> float:
+        """Retrieve the current XMR balance via `get_balance`.
+
+        Returns:
+            float: The wallet's balance in XMR.
+        """
+        result = await self._rpc.call("get_balance", {"account_index": 0})
+        return result["balance"] / _ATOMIC_UNITS
+
+    async def getUnlockedBalance(self) -> float:
+        """Retrieve the spendable XMR balance via `get_balance`.
+
+        Returns:
+            float: The wallet's unlocked balance in XMR.
+        """
+        result = await self._rpc.call("get_balance", {"account_index": 0})
+        return result["unlocked_balance"] / _ATOMIC_UNITS
+
+    async def send(self, amount: float, to_address: str, priority: typing.Literal["low", "medium", "high", "very high"]) -> None:
+        """Send Monero to another address via `transfer`.
+
+        Args:
+            amount (float): Amount of XMR to send.
+            to_address (str): Destination Monero address.
+            priority (Literal): Transaction priority ("low", "medium", "high", "very high").
+
+        Raises:
+            TransactionException: If the daemon rejects the transfer.
+            RPCConnectionException: If the request fails; the transfer may still have been relayed,
+                                    so it is not reported as a retryable TransactionException.
+        """
+        try:
+            await self._rpc.call("transfer", {
+                "destinations": [{"amount": round(amount * _ATOMIC_UNITS), "address": to_address}],
+                "priority": _priorityValue(priority)
+            })
+        except RPCConnectionException:
+            raise
+        except RPCException as e:
+            raise TransactionException(str(e)) from e
+        self._fee_cache.clear()
+
+    async def getBalanceAndFee(self, priority: typing.Literal["low", "medium", "high", "very high"]) -> tuple[float, float]:
+        """Get the spendable balance together with the estimated fee at a given priority.
+
+        Both values are fetched with a single batched request to the daemon,
+        unless the fee for this priority is already cached. The daemon cannot
+        build the estimate transaction without enough unlocked funds, so a
+        wallet with nothing unlocked reports a fee of 0, and one holding less
+        than a fee reports its whole balance as the fee, instead of failing.
+
+        Args:
+            priority (Literal): Transaction priority ("low", "medium", "high", "very high").
+
+        Returns:
+            tuple[float, float]: The wallet's unlocked balance and the estimated transaction fee, in XMR.
+
+        Raises:
+            TransactionException: If the daemon cannot build the estimate transaction for a funded wallet.
+        """
+        p = priority.lower()
+        if p in self._fee_cache:
+            return await self.getUnlockedBalance(), self._fee_cache[p]
+
+        try:
+            balance, estimate = await self._rpc.batchCall([
+                {"method": "get_balance", "params": {"account_index": 0}},
+                {"method": "transfer", "params": self._estimateParams(priority)}
+            ], return_exceptions=True)
+        except RPCException as e:
+            raise TransactionException(str(e)) from e
+        if isinstance(balance, RPCException):
+            raise TransactionException(str(balance)) from balance
+
+        unlocked = balance["unlocked_balance"] / _ATOMIC_UNITS
+        if unlocked == 0:
+            return 0.0, 0.0
+        if isinstance(estimate, RPCException):
+            if "not enough" in str(estimate).lower():
+                # dust below the fee; nothing can be sent from this wallet
+                return unlocked, unlocked
+            raise TransactionException(str(estimate)) from estimate
+        fee = self._fee_cache[p] = estimate["fee"] / _ATOMIC_UNITS
+        return unlocked, fee
+
+    def _estimateParams(self, priority: str) -> dict[str, typing.Any]:
+        """Build the parameters of the unrelayed self-transfer used to estimate fees.
+
+        Args:
+            priority (str): Transaction priority ("low", "medium", "high", "very high").
+
+        Returns:
+            dict: Parameters for the `transfer` RPC method.
+        """
+        return {
+            "destinations": [{"amount": 1, "address": self._address}],
+            "priority": _priorityValue(priority),
+            "do_not_relay": True
+        }
+
+    async def getTransferFee(self, priority: typing.Literal["low", "medium", "high", "very high"]) -> float:
+        """Get the estimated fee for a transaction at a given priority.
+
+        The fee is taken from a `transfer` to the wallet itself that is built
+        but not relayed, since wallet-rpc exposes no standalone fee estimate.
 
         Args:
             priority (Literal): Transaction priority ("low", "medium", "high", "very high").
+
+        Returns:
+            float: Estimated transaction fee in XMR.
+
+        Raises:
+            TransactionException: If the daemon cannot build the estimate transaction.
         """
-        match priority.lower():
-            case "low":
-                await self._page.select_option("div:nth-child(6) select", value="1")
-            case "medium":
-                await self._page.select_option("div:nth-child(6) select", value="2")
-            case "high":
-                await self._page.select_option("div:nth-child(6) select", value="3")
-            case "very high":
-                await self._page.select_option("div:nth-child(6) select", value="4")
+        p = priority.lower()
+        if p in self._fee_cache:
+            return self._fee_cache[p]
+
+        try:
+            result = await self._rpc.call("transfer", self._estimateParams(priority))
+        except RPCException as e:
+            raise TransactionException(str(e)) from e
+        fee = self._fee_cache[p] = result["fee"] / _ATOMIC_UNITS
+        return fee
 
     def __str__(self) -> str:
         """Return a string representation of the active wallet."""
@@ -0,0 +1,186 @@
+from __future__ import annotations
+from xmr.exceptions import RPCException, RPCConnectionException
+import aiohttp
+import asyncio
+import typing
+import os
+
+
+class WalletRPC:
+    """Minimal asynchronous JSON-RPC client for a running `monero-wallet-rpc` daemon.
+
+    A single daemon only keeps one wallet open at a time, so sessions opened
+    through this client are serialized with an internal lock.
+
+    Attributes:
+        _url (str): JSON-RPC endpoint of the wallet daemon.
+        _password (str): Password used for wallet files created on the daemon.
+        _wallet_dir (str): Directory the daemon keeps wallet files in (its `--wallet-dir`).
+        _timeout (float): Default time limit for a single request, in seconds.
+        _restore_height (int): Block height wallets are restored from.
+        _scan_timeout (float): Time limit for restoring and refreshing a wallet, in seconds.
+        _session (aiohttp.ClientSession): Lazily created HTTP session, reused across calls.
+        _lock (asyncio.Lock): Held while a wallet is open on the daemon.
+    """
+
+    __slots__ = ("_url", "_password", "_wallet_dir", "_timeout", "_restore_height", "_scan_timeout", "_session", "_lock")
+
+    def __init__(self, url: str = "http://127.0.0.1:18082/json_rpc", password: str = "", wallet_dir: str = "~/.xmr_obfuscator_wallets",
+                 timeout: float = 60, restore_height: int = 0, scan_timeout: float = 24*60*60):
+        """Initialize the client.
+
+        Args:
+            url (str, optional): JSON-RPC endpoint of `monero-wallet-rpc`. Defaults to a local daemon.
+            password (str, optional): Password for wallet files created on the daemon. Defaults to "".
+            wallet_dir (str, optional): The daemon's `--wallet-dir`, used to find wallet files
+                                        that were already restored. Defaults to "~/.xmr_obfuscator_wallets".
+            timeout (float, optional): Default time limit for a single request, in seconds. Defaults to 60.
+            restore_height (int, optional): Block height wallets are restored from; set it to a height
+                                            just before the wallets were created to skip scanning the
+                                            whole chain. Defaults to 0.
+            scan_timeout (float, optional): Time limit for restoring and refreshing a wallet, which scans
+                                            the chain from `restore_height`, in seconds. Defaults to 24 hours.
+        """
+        self._url = url
+        self._password = password
+        self._wallet_dir = os.path.expanduser(wallet_dir)
+        self._timeout = timeout
+        self._restore_height = restore_height
+        self._scan_timeout = scan_timeout
+        self._session = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def password(self) -> str:
+        """Return the password used for wallet files on the daemon."""
+        return self._password
+
+    @property
+    def walletDir(self) -> str:
+        """Return the directory the daemon keeps wallet files in."""
+        return self._wallet_dir
+
+    @property
+    def restoreHeight(self) -> int:
+        """Return the block height wallets are restored from."""
+        return self._restore_height
+
+    @property
+    def scanTimeout(self) -> float:
+        """Return the time limit for restoring and refreshing a wallet, in seconds."""
+        return self._scan_timeout
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Return the lock guarding the daemon's currently opened wallet."""
+        return self._lock
+
+    async def _post(self, payload: dict | list, timeout: float | None) -> typing.Any:
+        """Post a JSON-RPC payload and return the decoded response.
+
+        Args:
+            payload (dict | list): A single request or a batch of requests.
+            timeout (float, optional): Time limit in seconds; the client's default if None.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            RPCConnectionException: If the daemon cannot be reached, does not answer in time,
+                                    or answers with something other than JSON.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self._timeout))
+
+        kwargs = {} if timeout is None else {"timeout": aiohttp.ClientTimeout(total=timeout)}
+        try:
+            async with self._session.post(self._url, json=payload, **kwargs) as resp:
+                return await resp.json(content_type=None)
+        except asyncio.TimeoutError as e:
+            raise RPCConnectionException(f"No response from {self._url} in time") from e
+        except (aiohttp.ClientError, ValueError) as e:
+            raise RPCConnectionException(f"Request to {self._url} failed: {e}") from e
+
+    async def call(self, method: str, params: dict[str, typing.Any] | None = None, timeout: float | None = None) -> dict[str, typing.Any]:
+        """Invoke a single JSON-RPC method on the daemon.
+
+        Args:
+            method (str): Name of the RPC method (e.g. "get_balance").
+            params (dict, optional): Method parameters.
+            timeout (float, optional): Time limit in seconds for slow methods; the client's default if None.
+
+        Returns:
+            dict: The `result` object of the response.
+
+        Raises:
+            RPCException: If the daemon returns an error object.
+            RPCConnectionException: If the request itself fails or times out.
+        """
+        payload = {"jsonrpc": "2.0", "id": 0, "method": method}
+        if params is not None:
+            payload["params"] = params
+
+        data = await self._post(payload, timeout)
+
+        if "error" in data:
+            raise RPCException(data["error"].get("message", str(data["error"])))
+        return data["result"]
+
+    async def batchCall(self, calls: list[dict[str, typing.Any]], return_exceptions: bool = False) -> list[dict[str, typing.Any] | RPCException]:
+        """Invoke several JSON-RPC methods in a single HTTP round-trip.
+
+        The calls are posted as a JSON-RPC 2.0 batch. If the daemon does not
+        answer with a batch response, the calls are issued concurrently instead.
+
+        Args:
+            calls (list[dict]): Calls as `{"method": ..., "params": ...}` dicts.
+            return_exceptions (bool, optional): Put an RPCException in place of each failed
+                                                call's result instead of raising. Defaults to False.
+
+        Returns:
+            list[dict | RPCException]: The `result` objects, in the same order as `calls`.
+
+        Raises:
+            RPCException: If any of the calls returns an error object and `return_exceptions` is False.
+            RPCConnectionException: If the request itself fails or times out.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": call["method"], "params": call.get("params", {})}
+            for i, call in enumerate(calls)
+        ]
+
+        data = await self._post(payload, None)
+
+        if not isinstance(data, list):
+            results = await asyncio.gather(
+                *[self.call(call["method"], call.get("params")) for call in calls],
+                return_exceptions=return_exceptions
+            )
+            for result in results:
+                if isinstance(result, RPCConnectionException) or (isinstance(result, BaseException) and not isinstance(result, RPCException)):
+                    raise result
+            return list(results)
+
+        results = [None] * len(calls)
+        for entry in data:
+            if "error" in entry:
+                error = RPCException(entry["error"].get("message", str(entry["error"])))
+                if not return_exceptions:
+                    raise error
+                results[entry["id"]] = error
+            else:
+                results[entry["id"]] = entry["result"]
+        return results
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __str__(self) -> str:
+        """Return a string representation of the client."""
+        return f"WalletRPC({self._url})"
+
+
+__all__ = [ "WalletRPC" ]
@@ -0,0 +1,2 @@
+class GenerationException(Exception):
+    pass
\ No newline at end of file
@@ -0,0 +1,5 @@
+from xmr.exceptions.RPCException import RPCException
+
+
+class RPCConnectionException(RPCException):
+    pass
\ No newline at end of file
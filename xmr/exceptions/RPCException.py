@@ -0,0 +1,2 @@
+class RPCException(Exception):
+    pass
\ No newline at end of file
@@ -1,3 +1,6 @@
 from xmr.exceptions.TransactionException import TransactionException
+from xmr.exceptions.RPCException import RPCException
+from xmr.exceptions.RPCConnectionException import RPCConnectionException
+from xmr.exceptions.GenerationException import GenerationException
 
-__all__ = [ "TransactionException" ]
\ No newline at end of file
+__all__ = [ "TransactionException", "RPCException", "RPCConnectionException", "GenerationException" ]
\ No newline at end of file
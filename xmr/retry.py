@@ -0,0 +1,55 @@
+import asyncio
+import random
+import typing
+
+T = typing.TypeVar("T")
+
+
+async def retry(
+    coro_factory: typing.Callable[[], typing.Awaitable[T]],
+    max_attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+    full_jitter: bool = False,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+    on_error: typing.Callable[[int, BaseException], None] | None = None
+) -> T:
+    """Await a freshly created coroutine until it succeeds, backing off exponentially between attempts.
+
+    The delay after attempt `n` (0-based) is `base * 2**n * (1 + random() * jitter)`, capped at `cap`.
+    With `full_jitter`, it is drawn uniformly from `[0, min(cap, base * 2**n)]` instead, which
+    spreads out callers that failed at the same moment. No delay follows the final attempt.
+
+    Args:
+        coro_factory (Callable): Returns a new awaitable for every attempt.
+        max_attempts (int, optional): Maximum number of attempts. Defaults to 5.
+        base (float, optional): Delay in seconds after the first failure. Defaults to 1.0.
+        cap (float, optional): Upper bound for a single delay in seconds. Defaults to 30.0.
+        jitter (float, optional): Maximum relative random increase of each delay. Defaults to 0.5.
+        full_jitter (bool, optional): Draw each delay uniformly below its exponential bound. Defaults to False.
+        exceptions (tuple, optional): Exception types that trigger a retry; others propagate
+                                      immediately. Defaults to (Exception,).
+        on_error (Callable, optional): Called with the attempt index and exception after each failure.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        Exception: The exception of the last attempt if every attempt failed.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except exceptions as e:
+            if on_error is not None:
+                on_error(attempt, e)
+            if attempt == max_attempts - 1:
+                raise
+            if full_jitter:
+                await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
+            else:
+                await asyncio.sleep(min(cap, base * 2**attempt * (1 + random.random() * jitter)))
+
+
+__all__ = [ "retry" ]
@@ -1,5 +1,4 @@
 import random
-import requests
 
 USER_AGENTS = [
     # Chrome (Windows)
@@ -32,13 +31,24 @@ USER_AGENTS = [
     "Mozilla/5.0 (iPhone; CPU iPhone OS 17_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.6 Mobile/15E148 Safari/604.1"
 ]
 
+# headless flags that cut Chromium's memory and startup time without touching page behaviour
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=Translate,BackForwardCache",
+]
+
+_UA_CHOICE = random.choice
+_RANDINT = random.randint
 
 
 def get_ua():
-    return random.choice(USER_AGENTS)
+    return _UA_CHOICE(USER_AGENTS)
 
 def get_viewport():
     return {
-        "width": random.randint(1200, 1920),
-        "height": random.randint(700, 1080)
+        "width": _RANDINT(1200, 1920),
+        "height": _RANDINT(700, 1080)
     }
\ No newline at end of file